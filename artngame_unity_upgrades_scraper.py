@@ -1,11 +1,13 @@
 import asyncio
-import json
 import csv
+import hashlib
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from random import uniform
-from itertools import islice
-from playwright.async_api import async_playwright
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 # ------------------ Config ------------------
 DEFAULT_PUBLISHER = ("ARTnGAME", "https://assetstore.unity.com/publishers/6503?pageSize=96")
@@ -14,153 +16,338 @@ OUTPUT_TXT = "unity_upgrade_discounts.txt"
 OUTPUT_CSV = "unity_upgrade_discounts.csv"
 PROGRESS_FILE = "processed_assets.txt"
 
-BATCH_SIZE = 10
-DELAY_BETWEEN_BATCHES = 10  # seconds
+WORKERS = 8  # asset pages scraped concurrently
+NETWORK_IDLE_TIMEOUT = 15000  # ms an asset page may take to settle its XHRs
+HANDLER_TIMEOUT = 5  # seconds to finish reading responses after that
+FLUSH_EVERY = 50  # assets between result file flushes
 PAGE_SIZE = 96
+LISTING_CONCURRENCY = 4  # publisher listing pages fetched at once
+EXTRACT_THREADS = 4  # threads parsing JSON bodies off the event loop
+WRITE_BUFFER = 1 << 16  # bytes
+SLOW_MO = int(os.environ.get("ARTENGAME_SLOWMO", "0"))  # ms added to every browser action
+POLITE = os.environ.get("ARTENGAME_POLITE", "0") == "1"  # enables human_wait pauses
+# Never downloaded by the scraping context; no data is read from them
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# JSON keys extract_all reacts to
+PRICE_KEY = "offerRating"
+UPGRADE_KEYS = frozenset({"upgradeFrom", "upgradableFrom"})
+RESULTS_KEY = "results"
+ITEM_KEYS = frozenset({"product", "item"})
+NAME_KEYS = ITEM_KEYS | {RESULTS_KEY}
+ALL_TARGET_KEYS = UPGRADE_KEYS | NAME_KEYS | {PRICE_KEY}
+# Bit flags for the collectors still active in a subtree
+COLLECT_PRICES, COLLECT_UPGRADES, COLLECT_NAMES = 1, 2, 4
+ALL_COLLECTORS = COLLECT_PRICES | COLLECT_UPGRADES | COLLECT_NAMES
+TARGET_MARKS = {k: (k,) for k in ALL_TARGET_KEYS}  # stack marks, see extract_all
+# Raw-body probe for the quoted target keys; JSON responses without any
+# of them are not parsed
+JSON_PROBE = re.compile(b"|".join(re.escape(b'"%s"' % k.encode()) for k in sorted(ALL_TARGET_KEYS)))
 # --------------------------------------------
 
 # ------------------ Helpers -----------------
 async def human_wait(min_sec=2, max_sec=5, reason=""):
+    if not POLITE:
+        return
     wait_time = uniform(min_sec, max_sec)
     print(f"[wait] {reason} sleeping for {wait_time:.1f}s")
     await asyncio.sleep(wait_time)
 
-def save_txt_line(text):
-    with open(OUTPUT_TXT, "a", encoding="utf-8") as f:
-        f.write(text + "\n")
-
-def save_csv_row(row):
-    with open(OUTPUT_CSV, "a", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(row)
-
-def mark_processed(link):
-    with open(PROGRESS_FILE, "a", encoding="utf-8") as f:
-        f.write(link + "\n")
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+class ResultSink:
+    # Output files stay open for the whole run; rows are collected in memory
+    # and written out together every FLUSH_EVERY processed assets by flush().
+    def __init__(self):
+        self.txt = open(OUTPUT_TXT, "a", encoding="utf-8", buffering=WRITE_BUFFER)
+        self._csv_file = open(OUTPUT_CSV, "a", encoding="utf-8", newline="", buffering=WRITE_BUFFER)
+        self.csv_writer = csv.writer(self._csv_file)
+        # Append mode opens at the end, so position 0 means a new or empty CSV
+        self.csv_is_new = self._csv_file.tell() == 0
+        self.progress = open(PROGRESS_FILE, "a", encoding="utf-8", buffering=WRITE_BUFFER)
+        self.processed = load_processed()
+        self._txt_lines = []
+        self._csv_rows = []
+        self._progress_lines = []
+
+    def save_txt_line(self, text):
+        self._txt_lines.append(text + "\n")
+
+    def save_csv_row(self, row):
+        self._csv_rows.append(row)
+
+    def mark_processed(self, link):
+        self._progress_lines.append(link + "\n")
+        self.processed.add(link_key(link))
+        if len(self._progress_lines) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        # Results first, progress last, so a crash never marks an asset
+        # processed without its rows on disk.
+        self.txt.writelines(self._txt_lines)
+        self.csv_writer.writerows(self._csv_rows)
+        self.progress.writelines(self._progress_lines)
+        self._txt_lines.clear()
+        self._csv_rows.clear()
+        self._progress_lines.clear()
+        for f in (self.txt, self._csv_file, self.progress):
+            f.flush()
+            os.fsync(f.fileno())
+
+    def close(self):
+        self.flush()
+        for f in (self.txt, self._csv_file, self.progress):
+            f.close()
+
+def link_key(link):
+    # 64-bit digest kept in memory instead of the full URL; the progress
+    # file itself still lists URLs.
+    return int.from_bytes(hashlib.blake2b(link.encode(), digest_size=8).digest(), "little")
 
 def load_processed():
-    if not os.path.exists(PROGRESS_FILE):
+    try:
+        with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
+            return {link_key(l) for l in f.read().splitlines()}
+    except FileNotFoundError:
         return set()
-    with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
-        return set(l.strip() for l in f.readlines())
 
 def wrap_hyperlink(url, label=None):
     label = label or url
     return f'=HYPERLINK("{url}","{label}")'
 
-def extract_offer_rating(data, found_prices):
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if k == "offerRating" and isinstance(v, dict):
-                orig = v.get("originalPrice")
-                final = v.get("finalPrice")
-                if orig or final:
-                    found_prices.append((orig, final))
-            else:
-                extract_offer_rating(v, found_prices)
-    elif isinstance(data, list):
-        for item in data:
-            extract_offer_rating(item, found_prices)
-
-def extract_upgrade_from(data, upgrades):
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if k in ("upgradeFrom", "upgradableFrom"):
-                if isinstance(v, list):
-                    for upg in v:
-                        if isinstance(upg, dict):
-                            name = upg.get("name") or upg.get("title") or "Unknown"
-                            url = upg.get("url")
-                            upgrades.append((name, f"https://assetstore.unity.com{url}" if url else ""))
-                elif isinstance(v, dict):
-                    name = v.get("name") or v.get("title") or "Unknown"
-                    url = v.get("url")
-                    upgrades.append((name, f"https://assetstore.unity.com{url}" if url else ""))
+def upgrade_entry(upg):
+    name = upg.get("name") or upg.get("title") or "Unknown"
+    url = upg.get("url")
+    return (name, f"https://assetstore.unity.com{url}" if url else "")
+
+def add_unique(found, item):
+    # found is a dict used as an insertion-ordered set; read it via .values()
+    try:
+        found.setdefault(item, item)
+    except TypeError:
+        # Unhashable, e.g. a localized name dict; dedup on its repr instead
+        found.setdefault(repr(item), item)
+
+def extract_all(root, prices, upgrades, names):
+    # Single iterative walk collecting what the three old recursive walkers
+    # found, in the same order. Besides JSON values the stack holds one-item
+    # tuples, which JSON never produces: a (key,) mark sits on top of the
+    # value found under that target key, so the key is handled in document
+    # order, and a (mask,) entry restores the active collectors. As before,
+    # a collector does not descend into a value it has just consumed: that
+    # value is walked above a (mask,) entry with the remaining collectors.
+    active = ALL_COLLECTORS
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        # Children are pushed in reverse so siblings are visited in document order
+        if type(node) is dict:
+            if ALL_TARGET_KEYS.isdisjoint(node):
+                stack.extend(reversed(node.values()))
             else:
-                extract_upgrade_from(v, upgrades)
-    elif isinstance(data, list):
-        for item in data:
-            extract_upgrade_from(item, upgrades)
-
-def extract_asset_name(data, names):
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if k == "results" and isinstance(v, list):
-                for result in v:
-                    if isinstance(result, dict) and "name" in result:
-                        names.append(result["name"])
-            elif k in ("product", "item") and isinstance(v, dict):
-                if "name" in v:
-                    names.append(v["name"])
-            else:
-                extract_asset_name(v, names)
-    elif isinstance(data, list):
-        for item in data:
-            extract_asset_name(item, names)
-
-def batched(iterable, n):
-    it = iter(iterable)
-    while batch := list(islice(it, n)):
-        yield batch
+                for k, v in reversed(node.items()):
+                    stack.append(v)
+                    if k in ALL_TARGET_KEYS:
+                        stack.append(TARGET_MARKS[k])
+        elif type(node) is list:
+            stack.extend(reversed(node))
+        elif type(node) is tuple:
+            k = node[0]
+            if type(k) is int:
+                active = k
+                continue
+            v = stack.pop()
+            remaining = active
+            if k == PRICE_KEY:
+                if active & COLLECT_PRICES and isinstance(v, dict):
+                    orig = v.get("originalPrice")
+                    final = v.get("finalPrice")
+                    if orig or final:
+                        add_unique(prices, (orig, final))
+                    remaining &= ~COLLECT_PRICES
+            elif k in UPGRADE_KEYS:
+                if active & COLLECT_UPGRADES:
+                    if isinstance(v, list):
+                        for upg in v:
+                            if isinstance(upg, dict):
+                                add_unique(upgrades, upgrade_entry(upg))
+                    elif isinstance(v, dict):
+                        add_unique(upgrades, upgrade_entry(v))
+                    remaining &= ~COLLECT_UPGRADES
+            elif active & COLLECT_NAMES:
+                if k == RESULTS_KEY and isinstance(v, list):
+                    names.extend(r["name"] for r in v if isinstance(r, dict) and "name" in r)
+                    remaining &= ~COLLECT_NAMES
+                elif k in ITEM_KEYS and isinstance(v, dict):
+                    if "name" in v:
+                        names.append(v["name"])
+                    remaining &= ~COLLECT_NAMES
+            if remaining == active:
+                stack.append(v)
+            elif remaining:
+                stack.append((active,))
+                stack.append(v)
+                active = remaining
+
+def extract_from_body(raw):
+    # Runs in the extraction thread pool
+    prices, upgrades, names = {}, {}, []
+    extract_all(orjson.loads(raw), prices, upgrades, names)
+    return prices, upgrades, names
 
 # ------------------ Crawl all publisher pages ------------------
-async def collect_all_assets_by_url(page, base_url, page_size=PAGE_SIZE):
-    all_links = set()
-    page_num = 1
+async def collect_all_assets_by_url(context, base_url, page_size=PAGE_SIZE):
+    all_links = {}  # dict as an insertion-ordered set
+    semaphore = asyncio.Semaphore(LISTING_CONCURRENCY)
 
-    while True:
+    async def fetch_page(page_num):
         url = f"{base_url}&page={page_num}"
-        print(f"[crawl] Visiting {url} ...")
-        await page.goto(url, wait_until="domcontentloaded", timeout=120000)
-        await page.wait_for_timeout(2000)
-
-        asset_items = await page.query_selector_all("a[href^='/packages/']")
-        page_links = set()
-        for el in asset_items:
-            href = await el.get_attribute("href")
-            if href and "/packages/" in href:
-                page_links.add("https://assetstore.unity.com" + href)
-
-        num_assets = len(page_links)
-        if num_assets == 0:
-            print(f"[crawl] No assets found on page {page_num}. Stopping.")
-            break
-
-        print(f"[crawl] Found {num_assets} assets on page {page_num}")
-        all_links.update(page_links)
-
-        if num_assets < page_size:
-            print(f"[crawl] Less than {page_size} assets on page {page_num}. Reached last page.")
-            break
-
-        page_num += 1
-        await human_wait(1, 2, f"between page {page_num-1} and {page_num}")
+        async with semaphore:
+            page = await context.new_page()
+            try:
+                print(f"[crawl] Visiting {url} ...")
+                await page.goto(url, wait_until="domcontentloaded", timeout=120000)
+                await page.wait_for_timeout(2000)
+
+                hrefs = await page.eval_on_selector_all(
+                    "a[href^='/packages/']", "els => els.map(e => e.getAttribute('href'))"
+                )
+                return dict.fromkeys("https://assetstore.unity.com" + h for h in hrefs if h and "/packages/" in h)
+            finally:
+                await page.close()
+
+    # Page 1 alone, then LISTING_CONCURRENCY pages at a time while pages are full
+    candidates = range(1, 2)
+    reached_end = False
+    while not reached_end:
+        # Pages past the real last one may fail; their results are never read
+        results = await asyncio.gather(*[fetch_page(n) for n in candidates], return_exceptions=True)
+        for page_num, page_links in zip(candidates, results):
+            if isinstance(page_links, BaseException):
+                raise page_links
+            num_assets = len(page_links)
+            if num_assets == 0:
+                print(f"[crawl] No assets found on page {page_num}. Stopping.")
+                reached_end = True
+                break
+
+            print(f"[crawl] Found {num_assets} assets on page {page_num}")
+            all_links.update(page_links)
+
+            if num_assets < page_size:
+                print(f"[crawl] Less than {page_size} assets on page {page_num}. Reached last page.")
+                reached_end = True
+                break
+
+        if not reached_end:
+            next_page = candidates[-1] + 1
+            candidates = range(next_page, next_page + LISTING_CONCURRENCY)
+            await human_wait(1, 2, f"before pages {candidates[0]}-{candidates[-1]}")
 
     print(f"[crawl] Total assets collected: {len(all_links)}")
-    return sorted(all_links)
+    return list(all_links)
 
 # ------------------ Asset processing ------------------
-async def process_asset(context, link, publisher_name, publisher_page):
-    found_prices, upgrade_from, asset_names = [], [], []
-    page = await context.new_page()
+async def process_asset(page, link, executor):
+    # Fresh containers and handler per asset; the page itself is reused
+    found_prices, upgrade_from, asset_names = {}, {}, []
+    # Handler tasks are tracked so the asset is only written once every
+    # response seen before the listener was removed has been handled
+    handler_tasks = set()
 
     async def handle_response(response):
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
         try:
-            headers = await response.all_headers()
-            if "application/json" in (headers.get("content-type") or ""):
-                data = await response.json()
-                text = json.dumps(data)
-                if any(k in text for k in ["offerRating", "upgradeFrom", "upgradableFrom", "results", "product"]):
-                    extract_offer_rating(data, found_prices)
-                    extract_upgrade_from(data, upgrade_from)
-                    extract_asset_name(data, asset_names)
+            if "application/json" in response.headers.get("content-type", ""):
+                raw = await response.body()
+                if not JSON_PROBE.search(raw):
+                    return
+                prices, upgrades, names = await asyncio.get_running_loop().run_in_executor(
+                    executor, extract_from_body, raw
+                )
+                found_prices.update(prices)
+                upgrade_from.update(upgrades)
+                asset_names.extend(names)
         except Exception:
             pass
 
-    page.on("response", handle_response)
+    def on_response(response):
+        handler_tasks.add(asyncio.ensure_future(handle_response(response)))
+
+    # Unload the previous asset first so its still-open requests cannot
+    # answer into this asset's handler
+    await page.goto("about:blank")
+    page.on("response", on_response)
     print(f"  [open] {link}")
-    goto_task = page.goto(link, wait_until="domcontentloaded", timeout=120000)
-    return page, link, found_prices, upgrade_from, asset_names, goto_task
+    try:
+        await page.goto(link, wait_until="domcontentloaded", timeout=120000)
+        try:
+            await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            pass  # keep whatever responses arrived in time
+    finally:
+        page.remove_listener("response", on_response)
+    if handler_tasks:
+        # Bounded: a long-poll or streaming response never finishes its body
+        _, pending = await asyncio.wait(handler_tasks, timeout=HANDLER_TIMEOUT)
+        for task in pending:
+            task.cancel()
+    return found_prices, upgrade_from, asset_names
+
+def save_asset_result(sink, link, found_prices, upgrade_from, asset_names, publisher_name, publisher_hl):
+    asset_name = asset_names[0] if asset_names else link.split("/")[-1]
+
+    asset_url_hl = wrap_hyperlink(link, asset_name)
+
+    if found_prices:
+        for (orig, final) in found_prices.values():
+            if upgrade_from:
+                for (upg_name, upg_url) in upgrade_from.values():
+                    upg_url_hl = wrap_hyperlink(upg_url, upg_name) if upg_url else ""
+                    line = f"{asset_name} | Original: {orig or 'N/A'} | Final: {final or 'N/A'} | Upgrade from: {upg_name} ({upg_url}) | {link}"
+                    sink.save_txt_line(line)
+                    sink.save_csv_row([asset_name, orig or "N/A", final or "N/A", upg_name, upg_url_hl, asset_url_hl, publisher_name, publisher_hl])
+            else:
+                line = f"{asset_name} | Original: {orig or 'N/A'} | Final: {final or 'N/A'} | {link}"
+                sink.save_txt_line(line)
+                sink.save_csv_row([asset_name, orig or "N/A", final or "N/A", "", "", asset_url_hl, publisher_name, publisher_hl])
+    else:
+        line = f"{asset_name} | No offerRating found | {link}"
+        sink.save_txt_line(line)
+        sink.save_csv_row([asset_name, "", "", "", "", asset_url_hl, publisher_name, publisher_hl])
+
+    print("  " + line)
+    sink.mark_processed(link)
+
+async def asset_worker(context, executor, queue, sink, publisher_name, publisher_hl):
+    page = await context.new_page()
+    try:
+        while True:
+            link = await queue.get()
+            try:
+                found_prices, upgrade_from, asset_names = await process_asset(page, link, executor)
+                save_asset_result(sink, link, found_prices, upgrade_from, asset_names, publisher_name, publisher_hl)
+            except Exception as e:
+                # Left out of the progress file so the next run retries it
+                print(f"  [error] {link}: {e}")
+                # The tab may have crashed or been closed; go on with a fresh one
+                if not page.is_closed():
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+                page = await context.new_page()
+            finally:
+                queue.task_done()
+            await human_wait(0.2, 0.8, "before next asset")
+    finally:
+        await page.close()
 
 # ------------------ Main Async Routine ------------------
 async def main():
@@ -169,107 +356,100 @@ async def main():
 
     # Load publishers
     publishers = []
-    if os.path.exists("publishers.txt"):
+    try:
         with open("publishers.txt", "r", encoding="utf-8") as f:
             for line in f.readlines():
                 if line.strip() and "," in line:
                     name, url = line.strip().split(",", 1)
                     publishers.append((name.strip(), url.strip()))
+    except FileNotFoundError:
+        pass
     if not publishers:
         publishers = [DEFAULT_PUBLISHER]
 
-    if not os.path.exists(OUTPUT_CSV):
-        save_csv_row([
+    sink = ResultSink()
+    if sink.csv_is_new:
+        sink.save_csv_row([
             "Asset Name", "Original Price", "Final Price",
             "Upgrade From", "Upgrade URL", "Asset URL",
             "Publisher Name", "Publisher Page"
         ])
+    executor = ThreadPoolExecutor(max_workers=EXTRACT_THREADS)
+
+    try:
+        async with async_playwright() as p:
+            # Determine first-run headless behavior
+            first_headless = False
+            if not storage_exists:
+                print("[login] storage_state.json not found, forcing headed browser for login...")
+                browser = await p.chromium.launch(headless=False, slow_mo=SLOW_MO)
+                first_headless = True
+            else:
+                browser = await p.chromium.launch(headless=headless_arg, slow_mo=SLOW_MO)
+
+            # Create context
+            if storage_exists:
+                context = await browser.new_context(storage_state=STORAGE_STATE)
+                print(f"[login] Using saved login: {STORAGE_STATE}")
+            else:
+                context = await browser.new_context()
+                page = await context.new_page()
+                await page.goto("https://assetstore.unity.com/sign-in", wait_until="load")
+                input("🔑 Log in manually, then press Enter here to continue...")
+                await context.storage_state(path=STORAGE_STATE)
+                print(f"[login] Saved login session to {STORAGE_STATE}")
+                await page.close()
+                await context.close()
+                await browser.close()
+                # Relaunch headless browser after login if first_headless
+                browser = await p.chromium.launch(headless=headless_arg, slow_mo=SLOW_MO)
+                context = await browser.new_context(storage_state=STORAGE_STATE)
+            await context.route("**/*", block_heavy_resources)
+
+            # Loop through publishers
+            for publisher_name, publisher_url in publishers:
+                print(f"[start] Crawling publisher: {publisher_name} ({publisher_url})")
+                all_assets = await collect_all_assets_by_url(context, publisher_url, page_size=PAGE_SIZE)
+                all_assets = [l for l in all_assets if link_key(l) not in sink.processed]
+                print(f"[start] {len(all_assets)} assets left to process for {publisher_name}")
+
+                publisher_hl = wrap_hyperlink(publisher_url, publisher_name)
+                queue = asyncio.Queue()
+                for link in all_assets:
+                    queue.put_nowait(link)
+
+                print(f"\n[scrape] Processing {len(all_assets)} assets for {publisher_name} with {WORKERS} workers...")
+                workers = [asyncio.create_task(asset_worker(context, executor, queue, sink, publisher_name, publisher_hl))
+                           for _ in range(WORKERS)]
+                # Watch the workers too: a worker that dies is reported and the
+                # rest carry on, but if they all die join() would never return
+                join_task = asyncio.create_task(queue.join())
+                running = set(workers)
+                while not join_task.done():
+                    done, _ = await asyncio.wait({join_task, *running}, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done - {join_task}:
+                        running.discard(task)
+                        error = task.exception()
+                        print(f"[error] Asset worker stopped ({len(running)} left): {error}")
+                    if not running and not join_task.done():
+                        join_task.cancel()
+                        await asyncio.gather(join_task, return_exceptions=True)
+                        raise RuntimeError(f"all asset workers stopped for {publisher_name}") from error
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+                sink.flush()
+                print(f"[scrape] Done for {publisher_name}.")
 
-    processed = load_processed()
-
-    async with async_playwright() as p:
-        # Determine first-run headless behavior
-        first_headless = False
-        if not storage_exists:
-            print("[login] storage_state.json not found, forcing headed browser for login...")
-            browser = await p.chromium.launch(headless=False, slow_mo=30)
-            first_headless = True
-        else:
-            browser = await p.chromium.launch(headless=headless_arg, slow_mo=30)
-
-        # Create context
-        if storage_exists:
-            context = await browser.new_context(storage_state=STORAGE_STATE)
-            print(f"[login] Using saved login: {STORAGE_STATE}")
-        else:
-            context = await browser.new_context()
-            page = await context.new_page()
-            await page.goto("https://assetstore.unity.com/sign-in", wait_until="load")
-            input("🔑 Log in manually, then press Enter here to continue...")
-            await context.storage_state(path=STORAGE_STATE)
-            print(f"[login] Saved login session to {STORAGE_STATE}")
-            await page.close()
             await context.close()
             await browser.close()
-            # Relaunch headless browser after login if first_headless
-            browser = await p.chromium.launch(headless=headless_arg, slow_mo=30)
-            context = await browser.new_context(storage_state=STORAGE_STATE)
+    finally:
+        executor.shutdown()
+        sink.close()
 
-        # Loop through publishers
-        for publisher_name, publisher_url in publishers:
-            page = await context.new_page()
-            print(f"[start] Navigating to publisher: {publisher_name} ({publisher_url})")
-            await page.goto(publisher_url, wait_until="domcontentloaded", timeout=120000)
-            await human_wait(2, 3, "initial page load")
-            all_assets = await collect_all_assets_by_url(page, publisher_url, page_size=PAGE_SIZE)
-            await page.close()
-
-            for batch_num, batch_links in enumerate(batched(all_assets, BATCH_SIZE), start=1):
-                batch_links = [l for l in batch_links if l not in processed]
-                if not batch_links:
-                    continue
-
-                print(f"\n[batch {batch_num}] Processing {len(batch_links)} assets for {publisher_name}...")
-                tasks = [process_asset(context, link, publisher_name, publisher_url) for link in batch_links]
-                results = await asyncio.gather(*tasks)
-                await asyncio.gather(*[r[5] for r in results])
-                print(f"[wait] Waiting {DELAY_BETWEEN_BATCHES}s for network responses...")
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
-
-                for page, link, found_prices, upgrade_from, asset_names, _ in results:
-                    asset_name = asset_names[0] if asset_names else link.split("/")[-1]
-                    unique_prices = list(set(found_prices)) if found_prices else []
-
-                    asset_url_hl = wrap_hyperlink(link, asset_name)
-
-                    if unique_prices:
-                        for (orig, final) in unique_prices:
-                            if upgrade_from:
-                                for (upg_name, upg_url) in upgrade_from:
-                                    upg_url_hl = wrap_hyperlink(upg_url, upg_name) if upg_url else ""
-                                    line = f"{asset_name} | Original: {orig or 'N/A'} | Final: {final or 'N/A'} | Upgrade from: {upg_name} ({upg_url}) | {link}"
-                                    save_txt_line(line)
-                                    save_csv_row([asset_name, orig or "N/A", final or "N/A", upg_name, upg_url_hl, asset_url_hl, publisher_name, wrap_hyperlink(publisher_url, publisher_name)])
-                            else:
-                                line = f"{asset_name} | Original: {orig or 'N/A'} | Final: {final or 'N/A'} | {link}"
-                                save_txt_line(line)
-                                save_csv_row([asset_name, orig or "N/A", final or "N/A", "", "", asset_url_hl, publisher_name, wrap_hyperlink(publisher_url, publisher_name)])
-                    else:
-                        line = f"{asset_name} | No offerRating found | {link}"
-                        save_txt_line(line)
-                        save_csv_row([asset_name, "", "", "", "", asset_url_hl, publisher_name, wrap_hyperlink(publisher_url, publisher_name)])
-
-                    print("  " + line)
-                    mark_processed(link)
-                    await page.close()
-
-                print(f"[batch {batch_num}] Done for {publisher_name}.")
-                await human_wait(1, 3, "before next batch")
-
-        await context.close()
-        await browser.close()
-        print("\n✅ All assets processed. Program terminated.")
-        print(f"Results saved to:\n  - {OUTPUT_TXT}\n  - {OUTPUT_CSV}\nProgress saved in {PROGRESS_FILE}")
+    print("\n✅ All assets processed. Program terminated.")
+    print(f"Results saved to:\n  - {OUTPUT_TXT}\n  - {OUTPUT_CSV}\nProgress saved in {PROGRESS_FILE}")
 
 # ------------------ Run ------------------
 if __name__ == "__main__":